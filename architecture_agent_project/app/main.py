@@ -1,17 +1,60 @@
+import asyncio
 import uuid
+import errno
 import shutil
 import os
-import json # Added
-from fastapi import FastAPI, UploadFile, File, HTTPException
-from pydantic import ValidationError # Added
+import logging
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from collections import OrderedDict
+import io
+import re
+import tempfile
+import aiofiles
+import orjson
+from typing import BinaryIO, Dict, FrozenSet, List, NamedTuple, Optional, Tuple
+from fastapi import FastAPI, UploadFile, File, HTTPException, Response
+from pydantic import TypeAdapter, ValidationError # Added
 from .models import TextPromptRequest, ArchitectureDiagram, ArchitectureComponent, ArchitectureConnection, ApiResponse
 
+logger = logging.getLogger(__name__)
+
 UPLOADS_DIR = "uploaded_architectures"
 os.makedirs(UPLOADS_DIR, exist_ok=True)
 
 SAVED_ARCHITECTURES_DIR = "saved_architectures" # Added
 os.makedirs(SAVED_ARCHITECTURES_DIR, exist_ok=True) # Added
 
+# Dedicated threads for upload/save disk writes, so slow writes queue here instead
+# of tying up the event loop or the shared threadpool used by the framework.
+_IO_EXEC = ThreadPoolExecutor(max_workers=2, thread_name_prefix="arch-io")
+
+# Directory prefixes (with trailing separator) so handlers build paths by concatenation
+_UPLOADS_PREFIX = os.path.join(UPLOADS_DIR, "")
+_SAVED_ARCHITECTURES_PREFIX = os.path.join(SAVED_ARCHITECTURES_DIR, "")
+
+# Bound once so the save/get handlers call straight into pydantic-core.
+_DIAGRAM_ADAPTER = TypeAdapter(ArchitectureDiagram)
+_DIAGRAM_VALIDATE_JSON = _DIAGRAM_ADAPTER.validate_json
+_DIAGRAM_DUMP_JSON = _DIAGRAM_ADAPTER.dump_json
+
+# Validated architectures keyed by ID, each stored with the (inode, mtime_ns, size)
+# of the file it came from so changes on disk invalidate the entry; saves replace
+# the file by rename, so each one gets a new inode. Oldest first.
+# Plain GETs stream the file, so this cache is only read and filled by the
+# ?validate=1 path of get_architecture_endpoint.
+GET_CACHE_SIZE = 256
+_GET_CACHE: "OrderedDict[str, Tuple[Tuple[int, int, int], ArchitectureDiagram]]" = OrderedDict()
+
+def _file_version(file_stat: os.stat_result) -> Tuple[int, int, int]:
+    return (file_stat.st_ino, file_stat.st_mtime_ns, file_stat.st_size)
+
+def _cache_architecture(architecture_id: str, file_stat: os.stat_result, architecture: ArchitectureDiagram) -> None:
+    _GET_CACHE[architecture_id] = (_file_version(file_stat), architecture)
+    _GET_CACHE.move_to_end(architecture_id)
+    if len(_GET_CACHE) > GET_CACHE_SIZE:
+        _GET_CACHE.popitem(last=False)
+
 app = FastAPI(
     title="Architecture Agent API",
     version="0.1.0",
@@ -25,103 +68,232 @@ Supports:
 '''
 )
 
+# The root payload never changes, so it is serialized once at import.
+_ROOT_BODY = orjson.dumps({"message": "Welcome to the Architecture Agent API"})
+
+def _json_response(body: bytes) -> Response:
+    return Response(content=body, media_type="application/json")
+
 @app.get("/")
 async def read_root():
-    return {"message": "Welcome to the Architecture Agent API"}
+    return _json_response(_ROOT_BODY)
 
-# Placeholder for future agent endpoints
-@app.post("/api/v1/architecture/generate", response_model=ArchitectureDiagram)
-async def generate_architecture_endpoint(request: TextPromptRequest):
-    diagram_id = f"arch_{uuid.uuid4()}"
+# Component specs are (name, type, technology, description); connection specs are
+# (source_index, target_index, protocol, description) where the indices point into
+# the component specs. Both are plain tuples so a plan can be shared by the templates built from it.
+ComponentSpec = Tuple[str, str, str, str]
+ConnectionSpec = Tuple[int, int, str, str]
+
+# Every component the planner can emit, shared by all plans and templates
+_ANDROID_CLIENT: ComponentSpec = ("Android Client", "MobileClient", "Android/Kotlin/Java", "Native Android application interface.")
+_IOS_CLIENT: ComponentSpec = ("iOS Client", "MobileClient", "iOS/Swift", "Native iOS application interface.")
+_WEB_CLIENT: ComponentSpec = ("Web Client", "WebClient", "React/Angular/Vue", "Browser-based web application interface.")
+_API_GATEWAY: ComponentSpec = ("API Gateway", "APIGateway", "e.g., Kong/NGINX/AWS API Gateway", "Single entry point for all client requests.")
+_USER_SERVICE: ComponentSpec = ("User Service", "Microservice", "e.g., Python/FastAPI", "Manages user authentication, profiles, and settings.")
+_PRODUCT_SERVICE: ComponentSpec = ("Product Service", "Microservice", "e.g., Node.js/Express", "Manages product information or another specific domain.")
+_PRIMARY_DATABASE: ComponentSpec = ("Primary Database", "Database", "e.g., PostgreSQL/MongoDB/DynamoDB", "Persistent storage for application data.")
+_DEFAULT_CORE: ComponentSpec = ("Default Application Core", "Monolith", "Generic", "Basic application component generated due to lack of specific keywords.")
+
+_GENERATED_DESCRIPTION = "This architecture was automatically generated based on the provided prompt."
+_GENERATOR_VERSION = "0.1.0"
+
+# The words the planner reacts to, grouped by the part of the architecture they
+# trigger. A prompt is reduced to one bit per group (its signature), so there are
+# at most 32 distinct plans no matter how the prompts are worded. Matching is by
+# whole word, so plural and compound forms have to be listed explicitly.
+_SIGNATURE_KEYWORDS: Tuple[FrozenSet[str], ...] = (
+    frozenset({"android"}),
+    frozenset({"ios"}),
+    frozenset({"web", "website", "websites", "webapp", "webapps", "browser", "browsers"}),
+    frozenset({"api", "apis", "backend", "backends"}),
+    frozenset({"database", "databases", "storage"}),
+)
+_WORD_RE = re.compile(r"[a-z]+")
+
+PromptSignature = Tuple[int, int, int, int, int]
+
+def _prompt_signature(prompt: str) -> PromptSignature:
+    tokens = set(_WORD_RE.findall(prompt.lower()))
+    return tuple(int(not keywords.isdisjoint(tokens)) for keywords in _SIGNATURE_KEYWORDS)
+
+def _plan_architecture(signature: PromptSignature) -> Tuple[Tuple[ComponentSpec, ...], Tuple[ConnectionSpec, ...]]:
+    wants_android, wants_ios, wants_web, wants_backend, wants_database = signature
     components = []
     connections = []
-    prompt_lower = request.prompt.lower()
 
     # Client Components
     client_components = []
-    if "android" in prompt_lower:
-        comp_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=comp_id, name="Android Client", type="MobileClient", technology="Android/Kotlin/Java", description="Native Android application interface."))
-        client_components.append(comp_id)
-    if "ios" in prompt_lower:
-        comp_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=comp_id, name="iOS Client", type="MobileClient", technology="iOS/Swift", description="Native iOS application interface."))
-        client_components.append(comp_id)
-    if "web" in prompt_lower or "browser" in prompt_lower:
-        comp_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=comp_id, name="Web Client", type="WebClient", technology="React/Angular/Vue", description="Browser-based web application interface."))
-        client_components.append(comp_id)
+    if wants_android:
+        client_components.append(len(components))
+        components.append(_ANDROID_CLIENT)
+    if wants_ios:
+        client_components.append(len(components))
+        components.append(_IOS_CLIENT)
+    if wants_web:
+        client_components.append(len(components))
+        components.append(_WEB_CLIENT)
 
     # Backend Components
     backend_services = []
-    api_gateway_id = None
-    if "api" in prompt_lower or "backend" in prompt_lower:
-        api_gateway_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=api_gateway_id, name="API Gateway", type="APIGateway", technology="e.g., Kong/NGINX/AWS API Gateway", description="Single entry point for all client requests."))
-        
-        user_service_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=user_service_id, name="User Service", type="Microservice", technology="e.g., Python/FastAPI", description="Manages user authentication, profiles, and settings."))
-        backend_services.append(user_service_id)
-        connections.append(ArchitectureConnection(id=f"conn_{uuid.uuid4()}", source_component_id=api_gateway_id, target_component_id=user_service_id, protocol="HTTPS/REST", description="Routes user-related requests to User Service."))
+    api_gateway = None
+    if wants_backend:
+        api_gateway = len(components)
+        components.append(_API_GATEWAY)
+
+        user_service = len(components)
+        components.append(_USER_SERVICE)
+        backend_services.append(user_service)
+        connections.append((api_gateway, user_service, "HTTPS/REST", "Routes user-related requests to User Service."))
 
         # Add another generic service for illustration (Product Service as per original instructions)
-        product_service_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=product_service_id, name="Product Service", type="Microservice", technology="e.g., Node.js/Express", description="Manages product information or another specific domain."))
-        backend_services.append(product_service_id)
-        connections.append(ArchitectureConnection(id=f"conn_{uuid.uuid4()}", source_component_id=api_gateway_id, target_component_id=product_service_id, protocol="HTTPS/REST", description="Routes product-related requests to Product Service."))
+        product_service = len(components)
+        components.append(_PRODUCT_SERVICE)
+        backend_services.append(product_service)
+        connections.append((api_gateway, product_service, "HTTPS/REST", "Routes product-related requests to Product Service."))
 
     # Connect Clients to API Gateway
-    if api_gateway_id and client_components:
-        for client_id in client_components:
-            connections.append(ArchitectureConnection(id=f"conn_{uuid.uuid4()}", source_component_id=client_id, target_component_id=api_gateway_id, protocol="HTTPS", description="Client communication to backend via API Gateway."))
+    if api_gateway is not None and client_components:
+        for client in client_components:
+            connections.append((client, api_gateway, "HTTPS", "Client communication to backend via API Gateway."))
 
     # Database Component
-    if "database" in prompt_lower or "storage" in prompt_lower:
-        db_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=db_id, name="Primary Database", type="Database", technology="e.g., PostgreSQL/MongoDB/DynamoDB", description="Persistent storage for application data."))
+    if wants_database:
+        db = len(components)
+        components.append(_PRIMARY_DATABASE)
         if backend_services: # Connect backend services to database
-            for service_id in backend_services:
-                connections.append(ArchitectureConnection(id=f"conn_{uuid.uuid4()}", source_component_id=service_id, target_component_id=db_id, protocol="TCP/IP (specific to DB)", description=f"Service connection to Database."))
-    
+            for service in backend_services:
+                connections.append((service, db, "TCP/IP (specific to DB)", "Service connection to Database."))
+
     # Fallback if no components were generated
     if not components:
-        default_comp_id = f"comp_{uuid.uuid4()}"
-        components.append(ArchitectureComponent(id=default_comp_id, name="Default Application Core", type="Monolith", technology="Generic", description="Basic application component generated due to lack of specific keywords."))
+        default_comp = len(components)
+        components.append(_DEFAULT_CORE)
         # Still add DB if requested, even for the default component
-        if "database" in prompt_lower or "storage" in prompt_lower:
-             db_id = f"comp_{uuid.uuid4()}"
-             components.append(ArchitectureComponent(id=db_id, name="Primary Database", type="Database", technology="e.g., PostgreSQL/MongoDB/DynamoDB", description="Persistent storage for application data."))
-             connections.append(ArchitectureConnection(id=f"conn_{uuid.uuid4()}", source_component_id=default_comp_id, target_component_id=db_id, protocol="TCP/IP (specific to DB)", description="Default core connection to Database."))
-
-    return ArchitectureDiagram(
-        diagram_id=diagram_id,
-        name=f"Generated Architecture for: {request.prompt[:50]}...",
-        description="This architecture was automatically generated based on the provided prompt.",
-        components=components,
-        connections=connections,
-        metadata={"prompt": request.prompt, "generator_version": "0.1.0"}
+        if wants_database:
+            db = len(components)
+            components.append(_PRIMARY_DATABASE)
+            connections.append((default_comp, db, "TCP/IP (specific to DB)", "Default core connection to Database."))
+
+    return tuple(components), tuple(connections)
+
+def _uuid4_batch(count: int) -> List[uuid.UUID]:
+    # Same as calling uuid.uuid4() `count` times, but with a single os.urandom() call.
+    raw = os.urandom(16 * count)
+    return [uuid.UUID(bytes=raw[i:i + 16], version=4) for i in range(0, len(raw), 16)]
+
+class _ResponseTemplate(NamedTuple):
+    # Serialized generate response split around its per-request values. The body is
+    # literals[0] + value[slots[0]] + literals[1] + ... where slot 0 is the diagram
+    # name, slot 1 the prompt and slot 2 + i the ID prefixed with id_prefixes[i].
+    literals: Tuple[bytes, ...]
+    slots: Tuple[int, ...]
+    id_prefixes: Tuple[str, ...]
+
+_SLOT_RE = re.compile(rb'"__SLOT(\d+)__"')
+
+def _slot(index: int) -> str:
+    return f"__SLOT{index}__"
+
+def _build_response_template(signature: PromptSignature) -> _ResponseTemplate:
+    component_specs, connection_specs = _plan_architecture(signature)
+    component_ids = [_slot(3 + i) for i in range(len(component_specs))]
+    first_connection_slot = 3 + len(component_specs)
+
+    diagram = ArchitectureDiagram(
+        diagram_id=_slot(2),
+        name=_slot(0),
+        description=_GENERATED_DESCRIPTION,
+        components=[
+            ArchitectureComponent(id=comp_id, name=name, type=comp_type, technology=technology, description=description)
+            for comp_id, (name, comp_type, technology, description) in zip(component_ids, component_specs)
+        ],
+        connections=[
+            ArchitectureConnection(id=_slot(first_connection_slot + i), source_component_id=component_ids[source], target_component_id=component_ids[target], protocol=protocol, description=description)
+            for i, (source, target, protocol, description) in enumerate(connection_specs)
+        ],
+        metadata={"prompt": _slot(1), "generator_version": _GENERATOR_VERSION}
     )
 
+    parts = _SLOT_RE.split(_DIAGRAM_DUMP_JSON(diagram))
+    return _ResponseTemplate(
+        literals=tuple(parts[0::2]),
+        slots=tuple(int(slot) for slot in parts[1::2]),
+        id_prefixes=("arch_",) + ("comp_",) * len(component_specs) + ("conn_",) * len(connection_specs),
+    )
+
+# One pre-serialized response per prompt signature, built at import.
+_RESPONSE_TEMPLATES: Dict[PromptSignature, _ResponseTemplate] = {
+    signature: _build_response_template(signature)
+    for signature in itertools.product((0, 1), repeat=len(_SIGNATURE_KEYWORDS))
+}
+
+# Placeholder for future agent endpoints
+@app.post("/api/v1/architecture/generate", response_model=ArchitectureDiagram)
+async def generate_architecture_endpoint(request: TextPromptRequest):
+    template = _RESPONSE_TEMPLATES[_prompt_signature(request.prompt)]
+    uuids = _uuid4_batch(len(template.id_prefixes))
+
+    values = [
+        orjson.dumps(f"Generated Architecture for: {request.prompt[:50]}..."),
+        orjson.dumps(request.prompt),
+    ]
+    values.extend(orjson.dumps(f"{prefix}{uid}") for prefix, uid in zip(template.id_prefixes, uuids))
+
+    chunks = [template.literals[0]]
+    for slot, literal in zip(template.slots, template.literals[1:]):
+        chunks.append(values[slot])
+        chunks.append(literal)
+    return _json_response(b"".join(chunks))
+
+_EXTENSION_RE = re.compile(r"(\.[A-Za-z0-9]+(?:\.(?:gz|bz2|xz|zst))?)$")
+
+def _disk_fileno(src: BinaryIO) -> Optional[int]:
+    # File descriptor backing src, or None when its data only lives in memory.
+    if isinstance(src, tempfile.SpooledTemporaryFile):
+        # fileno() would force an in-memory spool to disk; a spool only has a
+        # name once it has rolled over to a real temporary file.
+        if src.name is None:
+            return None
+    try:
+        return src.fileno()
+    except (AttributeError, io.UnsupportedOperation):
+        return None
+
+def _copy_upload(src: BinaryIO, dst_path: str) -> None:
+    # Uploads are spooled by Starlette: small ones stay in memory, larger ones roll
+    # over to a temporary file. Those are copied in-kernel with sendfile(2).
+    with open(dst_path, "wb") as f_out:
+        in_fd = _disk_fileno(src) if hasattr(os, "sendfile") else None
+        if in_fd is not None:
+            out_fd = f_out.fileno()
+            start = offset = src.tell()
+            remaining = os.fstat(in_fd).st_size - offset
+            try:
+                while remaining > 0:
+                    sent = os.sendfile(out_fd, in_fd, offset, remaining)
+                    if sent == 0:
+                        break
+                    offset += sent
+                    remaining -= sent
+                return
+            except OSError:
+                # Filesystem without sendfile support; fall back if nothing was copied yet
+                if offset != start:
+                    raise
+        shutil.copyfileobj(src, f_out)
+
 @app.post("/api/v1/architecture/upload", response_model=ApiResponse)
 async def upload_architecture_endpoint(file: UploadFile = File(...)):
     try:
         original_filename = file.filename
-        file_extension = os.path.splitext(original_filename)[1]
-        # Ensure the extension, if present, starts with a dot or is empty
-        if file_extension and not file_extension.startswith('.'):
-            file_extension = f".{file_extension}"
-        elif not file_extension and original_filename and '.' in original_filename: # handle cases like "archive.tar.gz"
-             # try to get the full extension
-            parts = original_filename.split('.')
-            if len(parts) > 1:
-                file_extension = "." + ".".join(parts[1:])
-
+        # Keep the extension of the upload, including compressed ones like ".tar.gz"
+        extension_match = _EXTENSION_RE.search(original_filename or "")
+        file_extension = extension_match.group(1) if extension_match else ""
 
         unique_filename = f"{uuid.uuid4()}{file_extension}"
-        file_path = os.path.join(UPLOADS_DIR, unique_filename)
+        file_path = _UPLOADS_PREFIX + unique_filename
 
-        with open(file_path, "wb") as f_out:
-            shutil.copyfileobj(file.file, f_out)
+        await asyncio.get_running_loop().run_in_executor(_IO_EXEC, _copy_upload, file.file, file_path)
         
         return ApiResponse(
             success=True,
@@ -138,18 +310,44 @@ async def upload_architecture_endpoint(file: UploadFile = File(...)):
         if hasattr(file, 'file') and file.file and not file.file.closed:
             file.file.close()
 
+# Process umask, read once at import (os.umask can only be queried by setting it)
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _write_blob(file_path: str, data: bytes) -> None:
+    # Unbuffered write of already-encoded bytes to a temporary file in the same
+    # directory, renamed over file_path once complete. Concurrent saves of the same
+    # ID therefore never interleave: readers see one whole file or the other.
+    # No fsync: a crash right after a save can lose it, in exchange for not waiting
+    # on the disk. Add os.fsync(fd) before closing if saves must be durable.
+    # Short fixed prefix: the target name may already be at the filesystem's limit
+    fd, tmp_path = tempfile.mkstemp(prefix=".save-", suffix=".tmp", dir=os.path.dirname(file_path))
+    try:
+        try:
+            if hasattr(os, "fchmod"): # mkstemp creates 0o600; apply what open() would under the umask
+                os.fchmod(fd, 0o666 & ~_UMASK)
+            view = memoryview(data)
+            while view:
+                view = view[os.write(fd, view):]
+        finally:
+            os.close(fd)
+        os.replace(tmp_path, file_path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+
 @app.post("/api/v1/architecture/save", response_model=ApiResponse)
-async def save_architecture_endpoint(architecture_data: ArchitectureDiagram):
+async def save_architecture_endpoint(architecture_data: ArchitectureDiagram, pretty: bool = False):
     # Pydantic model ArchitectureDiagram already validates that diagram_id is present.
     # No need for: if not architecture_data.diagram_id: raise HTTPException(...)
 
-    filename = f"{architecture_data.diagram_id}.json"
-    file_path = os.path.join(SAVED_ARCHITECTURES_DIR, filename)
+    file_path = f"{_SAVED_ARCHITECTURES_PREFIX}{architecture_data.diagram_id}.json"
 
     try:
-        with open(file_path, "w") as f_out:
-            f_out.write(architecture_data.model_dump_json(indent=2))
-        
+        # Stored compact by default; ?pretty=1 indents the file for human readers.
+        payload = _DIAGRAM_DUMP_JSON(architecture_data, indent=2 if pretty else None)
+        await asyncio.get_running_loop().run_in_executor(_IO_EXEC, _write_blob, file_path, payload)
+
         return ApiResponse(
             success=True,
             message=f"Architecture '{architecture_data.diagram_id}' saved successfully.",
@@ -164,32 +362,56 @@ async def save_architecture_endpoint(architecture_data: ArchitectureDiagram):
         # print(f"Unexpected error saving architecture: {e}")
         raise HTTPException(status_code=500, detail=f"An unexpected error occurred while saving architecture: {e}")
 
+_NOT_FOUND_ERRNOS = frozenset({errno.ENOENT, errno.ENOTDIR, errno.ENAMETOOLONG})
+
 @app.get("/api/v1/architecture/{architecture_id}", response_model=ArchitectureDiagram)
-async def get_architecture_endpoint(architecture_id: str):
-    filename = f"{architecture_id}.json"
-    file_path = os.path.join(SAVED_ARCHITECTURES_DIR, filename)
+async def get_architecture_endpoint(architecture_id: str, validate: bool = False):
+    file_path = f"{_SAVED_ARCHITECTURES_PREFIX}{architecture_id}.json"
+
+    try:
+        fd = os.open(file_path, os.O_RDONLY)
+    except OSError as e:
+        # IDs that cannot name a file (too long, bad path component) are simply unknown
+        if e.errno in _NOT_FOUND_ERRNOS:
+            raise HTTPException(status_code=404, detail=f"Architecture with ID '{architecture_id}' not found.")
+        raise HTTPException(status_code=500, detail=f"Could not read architecture file for ID '{architecture_id}': {e}")
+
+    # Stat and read through the one descriptor, so the cache key and the bytes come
+    # from the same file even if a save replaces it in the meantime.
+    try:
+        file_stat = os.fstat(fd)
+        if validate:
+            cached = _GET_CACHE.get(architecture_id)
+            if cached is not None and cached[0] == _file_version(file_stat):
+                _GET_CACHE.move_to_end(architecture_id)
+                return cached[1]
+        async with aiofiles.open(fd, "rb", closefd=False) as f_in:
+            file_content = await f_in.read()
+    except IOError as e:
+        raise HTTPException(status_code=500, detail=f"Could not read architecture file for ID '{architecture_id}': {e}")
+    finally:
+        os.close(fd)
+
+    # Validate file content is not empty
+    if not file_content.strip():
+        raise HTTPException(status_code=500, detail=f"Architecture file for ID '{architecture_id}' is empty.")
 
-    if not os.path.exists(file_path):
-        raise HTTPException(status_code=404, detail=f"Architecture with ID '{architecture_id}' not found.")
+    # Saved files are already ArchitectureDiagram JSON, so by default they are returned
+    # as-is. ?validate=1 parses and validates the file first (e.g. after manual edits).
+    if not validate:
+        return _json_response(file_content)
 
     try:
-        with open(file_path, "r") as f_in:
-            file_content = f_in.read()
-            # Validate file content is not empty
-            if not file_content.strip():
-                 raise HTTPException(status_code=500, detail=f"Architecture file for ID '{architecture_id}' is empty.")
-            architecture_model = ArchitectureDiagram.model_validate_json(file_content)
+        architecture_model = _DIAGRAM_VALIDATE_JSON(file_content)
+        _cache_architecture(architecture_id, file_stat, architecture_model)
         return architecture_model
-    except FileNotFoundError: # Should be caught by os.path.exists, but good for defense
-        raise HTTPException(status_code=404, detail=f"Architecture file for ID '{architecture_id}' not found (race condition).")
-    except json.JSONDecodeError:
-        # Log the error (e.g., print or use a logging library)
-        # print(f"JSONDecodeError for {architecture_id}")
-        raise HTTPException(status_code=500, detail=f"Error parsing architecture file for ID '{architecture_id}'. File is not valid JSON.")
     except ValidationError as ve: # Pydantic's validation error
-        # Log the error (e.g., print(ve.errors()))
-        # print(f"ValidationError for {architecture_id}: {ve.errors()}")
-        raise HTTPException(status_code=500, detail=f"Error validating architecture file for ID '{architecture_id}'. Invalid data structure: {ve.errors()}")
+        # pydantic-core parses the JSON itself and reports syntax errors as "json_invalid"
+        if any(error["type"] == "json_invalid" for error in ve.errors(include_url=False)):
+            raise HTTPException(status_code=500, detail=f"Error parsing architecture file for ID '{architecture_id}'. File is not valid JSON.")
+        # The error list is only rendered if the log record is actually emitted
+        logger.warning("Validation failed for architecture file '%s': %s", architecture_id, ve)
+        raise HTTPException(status_code=500, detail=f"Error validating architecture file for ID '{architecture_id}'. Invalid data structure.")
     except IOError as e:
         # Log the error e
         # print(f"IOError for {architecture_id}: {e}")
@@ -2,31 +2,31 @@ from typing import List, Optional, Dict, Any
 from pydantic import BaseModel, Field
 
 class TextPromptRequest(BaseModel):
-    prompt: str = Field(..., example="I want to build an architecture for a social media app with live streaming.")
+    prompt: str = Field(..., json_schema_extra={"example": "I want to build an architecture for a social media app with live streaming."})
 
 class ArchitectureComponent(BaseModel):
-    id: str = Field(..., example="component_001")
-    name: str = Field(..., example="User Service")
-    type: str = Field(..., example="Microservice") # e.g., Microservice, Database, Frontend, API Gateway
-    technology: Optional[str] = Field(None, example="Python, FastAPI, PostgreSQL")
-    description: Optional[str] = Field(None, example="Handles user authentication and profile management.")
-    properties: Optional[Dict[str, Any]] = Field(None, example={"version": "1.2", "replicas": 3})
+    id: str = Field(..., json_schema_extra={"example": "component_001"})
+    name: str = Field(..., json_schema_extra={"example": "User Service"})
+    type: str = Field(..., json_schema_extra={"example": "Microservice"}) # e.g., Microservice, Database, Frontend, API Gateway
+    technology: Optional[str] = Field(None, json_schema_extra={"example": "Python, FastAPI, PostgreSQL"})
+    description: Optional[str] = Field(None, json_schema_extra={"example": "Handles user authentication and profile management."})
+    properties: Optional[Dict[str, Any]] = Field(None, json_schema_extra={"example": {"version": "1.2", "replicas": 3}})
 
 class ArchitectureConnection(BaseModel):
-    id: str = Field(..., example="conn_001")
-    source_component_id: str = Field(..., example="component_001")
-    target_component_id: str = Field(..., example="component_002")
-    protocol: Optional[str] = Field(None, example="HTTPS/REST")
-    description: Optional[str] = Field(None, example="Fetches user data for feed generation.")
-    properties: Optional[Dict[str, Any]] = Field(None, example={"retries": 3, "timeout_ms": 500})
+    id: str = Field(..., json_schema_extra={"example": "conn_001"})
+    source_component_id: str = Field(..., json_schema_extra={"example": "component_001"})
+    target_component_id: str = Field(..., json_schema_extra={"example": "component_002"})
+    protocol: Optional[str] = Field(None, json_schema_extra={"example": "HTTPS/REST"})
+    description: Optional[str] = Field(None, json_schema_extra={"example": "Fetches user data for feed generation."})
+    properties: Optional[Dict[str, Any]] = Field(None, json_schema_extra={"example": {"retries": 3, "timeout_ms": 500}})
 
 class ArchitectureDiagram(BaseModel):
-    diagram_id: str = Field(..., example="arch_diag_001")
-    name: str = Field(..., example="Social Media App Architecture")
-    description: Optional[str] = Field(None, example="Initial architecture design for the social media platform.")
+    diagram_id: str = Field(..., json_schema_extra={"example": "arch_diag_001"})
+    name: str = Field(..., json_schema_extra={"example": "Social Media App Architecture"})
+    description: Optional[str] = Field(None, json_schema_extra={"example": "Initial architecture design for the social media platform."})
     components: List[ArchitectureComponent] = []
     connections: List[ArchitectureConnection] = []
-    metadata: Optional[Dict[str, Any]] = Field(None, example={"version": "1.0", "author": "AI Agent"})
+    metadata: Optional[Dict[str, Any]] = Field(None, json_schema_extra={"example": {"version": "1.0", "author": "AI Agent"}})
 
 # For saving, we might just use the ArchitectureDiagram model itself.
 # class SaveArchitectureRequest(ArchitectureDiagram):
@@ -38,10 +38,10 @@ class ApiResponse(BaseModel):
     success: bool = True
 
 class DeveloperBuildRequest(BaseModel):
-    architecture_id: str = Field(..., example="arch_diag_001")
-    specific_requirements: Optional[Dict[str, Any]] = Field(None, example={"platform": "Android", "language": "Kotlin"})
+    architecture_id: str = Field(..., json_schema_extra={"example": "arch_diag_001"})
+    specific_requirements: Optional[Dict[str, Any]] = Field(None, json_schema_extra={"example": {"platform": "Android", "language": "Kotlin"}})
 
 class TesterGenerateRequest(BaseModel):
-    architecture_id: Optional[str] = Field(None, example="arch_diag_001")
-    build_id: Optional[str] = Field(None, example="build_001") # If tests are generated after a build
-    test_scope: Optional[str] = Field("basic", example="basic, regression, security")
+    architecture_id: Optional[str] = Field(None, json_schema_extra={"example": "arch_diag_001"})
+    build_id: Optional[str] = Field(None, json_schema_extra={"example": "build_001"}) # If tests are generated after a build
+    test_scope: Optional[str] = Field("basic", json_schema_extra={"example": "basic, regression, security"})
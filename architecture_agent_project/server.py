@@ -0,0 +1,25 @@
+import asyncio
+import os
+
+import uvicorn
+
+# Pick the fastest event loop available before uvicorn creates one:
+# io_uring (uringcore, Linux 5.11+), then uvloop, then the default asyncio loop.
+try:
+    import uringcore
+    asyncio.set_event_loop_policy(uringcore.EventLoopPolicy())
+except ImportError:
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
+
+if __name__ == "__main__":
+    # loop="none" keeps uvicorn from replacing the policy selected above
+    uvicorn.run(
+        "app.main:app",
+        host=os.environ.get("HOST", "127.0.0.1"),
+        port=int(os.environ.get("PORT", "8000")),
+        loop="none",
+    )
@@ -2,6 +2,7 @@ import pytest
 import os
 import json
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from fastapi.testclient import TestClient
 from io import BytesIO
 
@@ -71,6 +72,55 @@ def test_generate_architecture_empty_prompt(client: TestClient):
     # Expect default component if prompt is empty or unspecific
     assert any(comp["name"] == "Default Application Core" for comp in data["components"])
 
+def test_generate_architecture_response_is_valid_diagram(client: TestClient):
+    prompt = 'An "iOS" app with a backend\nand storage — café \\ edition'
+    response = client.post("/api/v1/architecture/generate", json={"prompt": prompt})
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    diagram = ArchitectureDiagram.model_validate_json(response.content)
+    assert diagram.diagram_id.startswith("arch_")
+    assert diagram.name == f"Generated Architecture for: {prompt[:50]}..."
+    assert diagram.metadata == {"prompt": prompt, "generator_version": "0.1.0"}
+    assert [c.name for c in diagram.components] == ["iOS Client", "API Gateway", "User Service", "Product Service", "Primary Database"]
+    assert all(c.id.startswith("comp_") for c in diagram.components)
+    assert all(c.id.startswith("conn_") for c in diagram.connections)
+    assert len(diagram.connections) == 5
+
+def test_generate_architecture_matches_whole_words(client: TestClient):
+    # "ios" inside "scenarios" and "api" inside "rapid" must not trigger components
+    payload = {"prompt": "Rapid prototyping for several usage scenarios."}
+    response = client.post("/api/v1/architecture/generate", json=payload)
+    assert response.status_code == 200
+    component_names = [comp["name"] for comp in response.json()["components"]]
+    assert component_names == ["Default Application Core"]
+
+@pytest.mark.parametrize("prompt,expected_names", [
+    ("website with APIs and databases", ["Web Client", "API Gateway", "User Service", "Product Service", "Primary Database"]),
+    ("A webapp for two browsers", ["Web Client"]),
+    ("Several backends sharing storage", ["API Gateway", "User Service", "Product Service", "Primary Database"]),
+])
+def test_generate_architecture_matches_plural_and_compound_forms(client: TestClient, prompt: str, expected_names: list):
+    response = client.post("/api/v1/architecture/generate", json={"prompt": prompt})
+    assert response.status_code == 200
+    assert [comp["name"] for comp in response.json()["components"]] == expected_names
+
+def test_generate_architecture_repeated_prompt_gets_fresh_ids(client: TestClient):
+    payload = {"prompt": "A web app with a backend and storage."}
+    first = client.post("/api/v1/architecture/generate", json=payload).json()
+    second = client.post("/api/v1/architecture/generate", json=payload).json()
+    # Same structure for the same prompt...
+    assert [c["name"] for c in first["components"]] == [c["name"] for c in second["components"]]
+    assert len(first["connections"]) == len(second["connections"])
+    # ...but every diagram, component and connection gets a new ID
+    first_ids = {first["diagram_id"]} | {c["id"] for c in first["components"] + first["connections"]}
+    second_ids = {second["diagram_id"]} | {c["id"] for c in second["components"] + second["connections"]}
+    assert not first_ids & second_ids
+    # Connections reference components of their own diagram
+    component_ids = {c["id"] for c in second["components"]}
+    for conn in second["connections"]:
+        assert conn["source_component_id"] in component_ids
+        assert conn["target_component_id"] in component_ids
+
 
 def test_upload_architecture_diagram(client: TestClient):
     # Create a dummy file content
@@ -93,6 +143,40 @@ def test_upload_architecture_diagram(client: TestClient):
     if os.path.exists(uploaded_file_path):
         os.remove(uploaded_file_path)
 
+@pytest.mark.parametrize("filename,expected_extension", [
+    ("diagram.drawio", ".drawio"),
+    ("diagrams.tar.gz", ".tar.gz"),
+    ("my.diagram.v2.png", ".png"),
+    ("no_extension", ""),
+])
+def test_upload_keeps_file_extension(client: TestClient, filename: str, expected_extension: str):
+    file_to_upload = (filename, BytesIO(b"diagram"), "application/octet-stream")
+    response = client.post("/api/v1/architecture/upload", files={"file": file_to_upload})
+    assert response.status_code == 200
+    file_id = response.json()["data"]["file_id"]
+    assert file_id == file_id.split(".")[0] + expected_extension
+
+    # Clean up the created file
+    uploaded_file_path = os.path.join(UPLOADS_DIR, file_id)
+    if os.path.exists(uploaded_file_path):
+        os.remove(uploaded_file_path)
+
+def test_upload_large_architecture_diagram(client: TestClient):
+    # Large enough that the upload is spooled to disk rather than kept in memory
+    dummy_file_content = os.urandom(2 * 1024 * 1024 + 123)
+    file_to_upload = ("large_diagram.png", BytesIO(dummy_file_content), "image/png")
+
+    response = client.post("/api/v1/architecture/upload", files={"file": file_to_upload})
+
+    assert response.status_code == 200
+    uploaded_file_path = os.path.join(UPLOADS_DIR, response.json()["data"]["file_id"])
+    with open(uploaded_file_path, "rb") as f:
+        assert f.read() == dummy_file_content
+
+    # Clean up the created file
+    if os.path.exists(uploaded_file_path):
+        os.remove(uploaded_file_path)
+
 def test_save_architecture(client: TestClient):
     test_diagram_id = f"test_arch_{os.urandom(4).hex()}"
     architecture_data = {
@@ -122,6 +206,63 @@ def test_save_architecture(client: TestClient):
     if os.path.exists(saved_file_path):
         os.remove(saved_file_path)
 
+def test_save_architecture_pretty(client: TestClient):
+    test_diagram_id = f"test_arch_{os.urandom(4).hex()}"
+    architecture_data = {"diagram_id": test_diagram_id, "name": "Test Pretty Save"}
+    saved_file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{test_diagram_id}.json")
+
+    # Compact by default
+    response = client.post("/api/v1/architecture/save", json=architecture_data)
+    assert response.status_code == 200
+    with open(saved_file_path, "r") as f:
+        assert len(f.read().strip().splitlines()) == 1
+
+    # Indented on request
+    response = client.post("/api/v1/architecture/save", params={"pretty": 1}, json=architecture_data)
+    assert response.status_code == 200
+    with open(saved_file_path, "r") as f:
+        content = f.read()
+    assert len(content.strip().splitlines()) > 1
+    assert json.loads(content)["name"] == "Test Pretty Save"
+
+    # Clean up
+    if os.path.exists(saved_file_path):
+        os.remove(saved_file_path)
+
+def test_save_architecture_long_id(client: TestClient):
+    # The longest ID whose "<id>.json" still fits in a 255-byte filename
+    test_diagram_id = "a" * 240 + os.urandom(5).hex()
+    response = client.post("/api/v1/architecture/save", json={"diagram_id": test_diagram_id, "name": "Long ID"})
+    assert response.status_code == 200
+
+    saved_file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{test_diagram_id}.json")
+    with open(saved_file_path, "r") as f:
+        assert json.load(f)["name"] == "Long ID"
+
+    # Clean up
+    if os.path.exists(saved_file_path):
+        os.remove(saved_file_path)
+
+def test_concurrent_saves_of_same_id_do_not_tear_file(client: TestClient):
+    test_diagram_id = f"test_arch_{os.urandom(4).hex()}"
+    payloads = [
+        {"diagram_id": test_diagram_id, "name": "Small"},
+        {"diagram_id": test_diagram_id, "name": "Large", "description": "x" * 100_000},
+    ]
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        responses = list(pool.map(lambda i: client.post("/api/v1/architecture/save", json=payloads[i % 2]), range(40)))
+    assert all(r.status_code == 200 for r in responses)
+
+    # The file holds exactly one of the saves, and no temporary files are left behind
+    saved_file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{test_diagram_id}.json")
+    with open(saved_file_path, "r") as f:
+        assert json.load(f)["name"] in ("Small", "Large")
+    assert [name for name in os.listdir(SAVED_ARCHITECTURES_DIR) if test_diagram_id in name] == [f"{test_diagram_id}.json"]
+
+    # Clean up
+    if os.path.exists(saved_file_path):
+        os.remove(saved_file_path)
+
 def test_get_architecture_found(client: TestClient):
     # First, save an architecture to retrieve
     arch_id = f"get_test_arch_{os.urandom(4).hex()}"
@@ -146,12 +287,108 @@ def test_get_architecture_found(client: TestClient):
     if os.path.exists(file_path):
         os.remove(file_path)
 
+def test_get_architecture_sees_file_changes(client: TestClient):
+    arch_id = f"get_test_arch_{os.urandom(4).hex()}"
+    response = client.post("/api/v1/architecture/save", json={"diagram_id": arch_id, "name": "Before"})
+    assert response.status_code == 200
+    validate = {"validate": 1}
+    assert client.get(f"/api/v1/architecture/{arch_id}", params=validate).json()["name"] == "Before"
+
+    # Rewrite the file behind the API's back; the cached copy must not be served
+    file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{arch_id}.json")
+    mtime_ns = os.stat(file_path).st_mtime_ns
+    with open(file_path, "w") as f:
+        f.write(ArchitectureDiagram(diagram_id=arch_id, name="After").model_dump_json())
+    os.utime(file_path, ns=(mtime_ns + 1_000_000_000, mtime_ns + 1_000_000_000))
+
+    assert client.get(f"/api/v1/architecture/{arch_id}", params=validate).json()["name"] == "After"
+
+    # Clean up
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    assert client.get(f"/api/v1/architecture/{arch_id}").status_code == 404
+
+def test_get_architecture_validate_sees_same_size_save(client: TestClient):
+    arch_id = f"get_test_arch_{os.urandom(4).hex()}"
+    validate = {"validate": 1}
+    response = client.post("/api/v1/architecture/save", json={"diagram_id": arch_id, "name": "AAAA"})
+    assert response.status_code == 200
+    assert client.get(f"/api/v1/architecture/{arch_id}", params=validate).json()["name"] == "AAAA"
+
+    # Same size, and the mtime is forced back to the old value: only the inode differs
+    file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{arch_id}.json")
+    file_stat = os.stat(file_path)
+    response = client.post("/api/v1/architecture/save", json={"diagram_id": arch_id, "name": "BBBB"})
+    assert response.status_code == 200
+    os.utime(file_path, ns=(file_stat.st_atime_ns, file_stat.st_mtime_ns))
+    assert os.stat(file_path).st_size == file_stat.st_size
+
+    assert client.get(f"/api/v1/architecture/{arch_id}", params=validate).json()["name"] == "BBBB"
+
+    # Clean up
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+def test_get_architecture_validate_rejects_invalid_file(client: TestClient):
+    arch_id = f"get_test_arch_{os.urandom(4).hex()}"
+    file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{arch_id}.json")
+    with open(file_path, "w") as f:
+        f.write(json.dumps({"diagram_id": arch_id})) # "name" is missing
+
+    # Served as stored by default...
+    response = client.get(f"/api/v1/architecture/{arch_id}")
+    assert response.status_code == 200
+    assert response.json() == {"diagram_id": arch_id}
+
+    # ...but rejected when validation is requested
+    response = client.get(f"/api/v1/architecture/{arch_id}", params={"validate": 1})
+    assert response.status_code == 500
+    assert "Error validating architecture file" in response.json()["detail"]
+
+    # Clean up
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+def test_get_architecture_validate_reports_malformed_json(client: TestClient):
+    arch_id = f"get_test_arch_{os.urandom(4).hex()}"
+    file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{arch_id}.json")
+    with open(file_path, "w") as f:
+        f.write('{"diagram_id": "truncated') # Not valid JSON
+
+    response = client.get(f"/api/v1/architecture/{arch_id}", params={"validate": 1})
+    assert response.status_code == 500
+    assert response.json()["detail"] == f"Error parsing architecture file for ID '{arch_id}'. File is not valid JSON."
+
+    # Clean up
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
 def test_get_architecture_not_found(client: TestClient):
     non_existent_id = "arch_id_does_not_exist_12345"
     response = client.get(f"/api/v1/architecture/{non_existent_id}")
     assert response.status_code == 404
     assert response.json()["detail"] == f"Architecture with ID '{non_existent_id}' not found."
 
+def test_get_architecture_whitespace_file_is_empty(client: TestClient):
+    arch_id = f"get_test_arch_{os.urandom(4).hex()}"
+    file_path = os.path.join(SAVED_ARCHITECTURES_DIR, f"{arch_id}.json")
+    with open(file_path, "w") as f:
+        f.write(" \n\t\n")
+
+    response = client.get(f"/api/v1/architecture/{arch_id}")
+    assert response.status_code == 500
+    assert response.json()["detail"] == f"Architecture file for ID '{arch_id}' is empty."
+
+    # Clean up
+    if os.path.exists(file_path):
+        os.remove(file_path)
+
+def test_get_architecture_overlong_id_not_found(client: TestClient):
+    overlong_id = "a" * 300 # Longer than any filename the filesystem accepts
+    response = client.get(f"/api/v1/architecture/{overlong_id}")
+    assert response.status_code == 404
+    assert response.json()["detail"] == f"Architecture with ID '{overlong_id}' not found."
+
 # Basic tests for stub endpoints
 def test_developer_build_stub(client: TestClient):
     payload = {"architecture_id": "some_arch_id", "specific_requirements": {"platform": "iOS"}}
@@ -169,6 +406,14 @@ def test_tester_generate_tests_stub(client: TestClient):
     assert "Tester agent generate tests placeholder" in response.json()["message"]
     assert response.json()["received_payload"] == payload
 
+@pytest.mark.parametrize("path", ["/api/v1/developer/build", "/api/v1/tester/generate-tests"])
+def test_stub_echoes_big_int_payload(client: TestClient, path: str):
+    # Integers wider than 64 bits are valid JSON and must be echoed back unchanged
+    payload = {"x": 2**70}
+    response = client.post(path, json=payload)
+    assert response.status_code == 200
+    assert response.json()["received_payload"] == payload
+
 # Fixture for cleaning up directories after all tests in the file run
 # This is an alternative to cleaning in client() fixture's exit part if preferred
 # For simplicity, the client fixture already handles cleanup.